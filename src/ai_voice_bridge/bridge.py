@@ -1,13 +1,25 @@
 import asyncio
-import base64
-import json
 import logging
+import queue
 
 import numpy as np
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Decoder base64 com SIMD (SSE4/AVX2); cai para a stdlib se indisponível
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from base64 import b64decode as _b64decode
+
+try:
+    # Codec MessagePack opcional, usado quando o cliente negocia o subprotocolo
+    import msgpack
+except ImportError:
+    msgpack = None
+
 try:
     import sounddevice as sd
 except (ImportError, OSError):
@@ -25,16 +37,93 @@ from ai_voice_bridge.strategies.always_on import AlwaysOnStrategy
 # Sample rate do áudio de saída do Gemini
 _AUDIO_SAMPLE_RATE = 24000
 
+# Sentinela para mensagens sem áudio (evita alternar entre None e bytes)
+_EMPTY = b""
+# Dict vazio compartilhado para chaves ausentes (evita criar {} por miss).
+# Nunca é modificado; precisa ser dict porque o parse usa dict.get direto.
+_NO_CONTENT: dict = {}
+
+
+def _text_frame(data: dict) -> dict:
+    """Monta a mensagem ASGI de um frame de texto JSON.
+
+    A mesma mensagem é compartilhada por todos os clientes de um broadcast,
+    então a serialização e a decodificação UTF-8 acontecem uma única vez.
+    """
+    return {"type": "websocket.send", "text": orjson.dumps(data).decode()}
+
+
+def _bytes_frame(data: bytes) -> dict:
+    """Monta a mensagem ASGI de um frame binário (áudio PCM)."""
+    return {"type": "websocket.send", "bytes": data}
+
+
+def _msgpack_frame(data: dict) -> dict:
+    """Monta a mensagem ASGI de um frame binário MessagePack."""
+    return {"type": "websocket.send", "bytes": msgpack.packb(data)}
+
+
+def _event_frames(data: dict) -> tuple[dict, dict | None]:
+    """Retorna (frame JSON, frame MessagePack) de um evento constante."""
+    return _text_frame(data), (_msgpack_frame(data) if msgpack else None)
+
+
+# Subprotocolo em que todos os frames (inclusive áudio) são MessagePack
+_MSGPACK_SUBPROTOCOL = "msgpack"
+
+# Frames de controle constantes, serializados uma única vez por codec.
+# Em JSON, controle trafega em frames de texto: binários são reservados ao áudio.
+_MSG_CONNECTED = _event_frames({"type": "connected"})
+_MSG_READY = _event_frames({"type": "ready"})
+_MSG_TURN_COMPLETE = _event_frames({"type": "turn_complete"})
+_MSG_SPEAKING_TRUE = _event_frames({"type": "speaking", "value": True})
+_MSG_SPEAKING_FALSE = _event_frames({"type": "speaking", "value": False})
+
+# Frames pendentes por cliente antes de considerá-lo lento e desconectar
+_CLIENT_QUEUE_SIZE = 64
+# Áudio só ocupa parte da fila: o resto fica reservado aos frames de controle.
+# Acima disso o áudio é descartado em vez de desconectar o cliente.
+_CLIENT_AUDIO_LIMIT = 48
+
+
+class _Client:
+    """Conexão WebSocket com fila de saída drenada por uma task dedicada."""
+
+    def __init__(self, websocket: WebSocket, use_msgpack: bool = False) -> None:
+        self.websocket = websocket
+        # Índice no par (JSON, MessagePack) de cada broadcast
+        self.use_msgpack = use_msgpack
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+        self.writer: asyncio.Task | None = None
+        self.dropped = False  # True quando desconectado por lentidão
+        self.audio_dropped = 0  # Frames de áudio descartados na lentidão atual
+
 
 class VoiceBridge:
     """Coordena conexões WebSocket, estratégia e cliente Gemini."""
 
     def __init__(self) -> None:
         self._gemini = GeminiClient()
-        self._connections: set[WebSocket] = set()
+        self._connections: dict[WebSocket, _Client] = {}
+        self._msgpack_clients = 0  # Só serializa em MessagePack se houver
         self._strategy = self._create_strategy()
         self._response_task: asyncio.Task | None = None
-        self._audio_buffer: list[bytes] = []  # Buffer para debug de áudio local
+        self._turn_requested = asyncio.Event()  # Sinaliza start_talking
+        self._audio_buffer = bytearray()  # Buffer para debug de áudio local
+        # Áudio de saída acumulado até completar a janela de coalescência
+        self._audio_chunks: list[bytes] = []
+        self._audio_pending_bytes = 0
+        self._audio_window_bytes = (
+            settings.audio_coalesce_ms * _AUDIO_SAMPLE_RATE * 2 // 1000
+        )
+        self._audio_flush_handle: asyncio.TimerHandle | None = None
+        # Último 'speaking' enviado: o evento só sai quando o estado muda
+        self._speaking = False
+        # [DEBUG] Playback local via callback, fora do event loop
+        self._sd_stream = None  # sd.OutputStream criado sob demanda
+        self._sd_queue: queue.Queue[np.ndarray] = queue.Queue()
+        self._sd_pending: np.ndarray | None = None
+        self._sd_pos = 0
 
     def _create_strategy(self) -> SessionStrategy:
         """Cria estratégia baseada na configuração."""
@@ -48,39 +137,127 @@ class VoiceBridge:
         """Inicializa o bridge (estratégia e conexões)."""
         logger.info("[bridge] Inicializando estratégia...")
         await self._strategy.initialize()
+        self._response_task = asyncio.create_task(self._response_loop())
         logger.info("[bridge] Bridge pronto.")
 
     async def handle_connection(self, websocket: WebSocket) -> None:
         """Gerencia uma nova conexão WebSocket (FastAPI)."""
-        await websocket.accept()
-        self._connections.add(websocket)
+        use_msgpack = msgpack is not None and _MSGPACK_SUBPROTOCOL in (
+            websocket.scope.get("subprotocols") or ()
+        )
+        await websocket.accept(
+            subprotocol=_MSGPACK_SUBPROTOCOL if use_msgpack else None
+        )
         client_addr = websocket.client
-        logger.info("[bridge] Cliente conectado: %s", client_addr)
+        logger.info(
+            "[bridge] Cliente conectado: %s (%s)",
+            client_addr,
+            "msgpack" if use_msgpack else "json",
+        )
 
+        client = _Client(websocket, use_msgpack)
+        # 'connected' e 'ready' saem pela fila, antes de qualquer broadcast
+        client.queue.put_nowait(_MSG_CONNECTED[use_msgpack])
+        client.queue.put_nowait(_MSG_READY[use_msgpack])
+        if self._speaking:
+            # Entrou no meio de uma fala: não receberia o 'speaking' de novo
+            client.queue.put_nowait(_MSG_SPEAKING_TRUE[use_msgpack])
+
+        # A task de escrita vive no escopo da conexão
+        async with asyncio.TaskGroup() as tg:
+            client.writer = tg.create_task(self._writer_loop(client))
+            self._connections[websocket] = client
+            self._msgpack_clients += use_msgpack
+            try:
+                await self._receive_loop(websocket)
+            except WebSocketDisconnect:
+                logger.info("[bridge] Cliente desconectado: %s", client_addr)
+            except Exception as e:
+                logger.error("[bridge] Erro na conexão %s: %s", client_addr, e)
+            finally:
+                self._remove_client(websocket)
+
+    async def _receive_loop(self, websocket: WebSocket) -> None:
+        """Lê mensagens do cliente até a desconexão."""
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if "text" in message:
+                await self._process_message(message["text"])
+            elif "bytes" in message:
+                await self._handle_audio(message["bytes"])
+
+    async def _writer_loop(self, client: _Client) -> None:
+        """Drena a fila de saída do cliente para o WebSocket."""
+        websocket = client.websocket
+        batch_delay = settings.control_batch_ms / 1000
         try:
-            # Envia 'connected' e 'ready'
-            await websocket.send_text(json.dumps({"type": "connected"}))
-            await websocket.send_text(json.dumps({"type": "ready"}))
-
-            # Loop de mensagens
             while True:
-                message = await websocket.receive()
-                if "text" in message:
-                    await self._process_message(message["text"])
-                elif "bytes" in message:
-                    await self._handle_audio(message["bytes"])
-
-        except WebSocketDisconnect:
-            logger.info("[bridge] Cliente desconectado: %s", client_addr)
+                msg = await client.queue.get()
+                if batch_delay > 0 and "text" in msg:
+                    await self._send_control_batch(client, msg, batch_delay)
+                else:
+                    await websocket.send(msg)
+        except asyncio.CancelledError:
+            if client.dropped:
+                try:
+                    await websocket.close(code=1008)
+                except Exception:
+                    pass
         except Exception as e:
-            logger.error("[bridge] Erro na conexão %s: %s", client_addr, e)
-        finally:
-            self._connections.discard(websocket)
+            logger.debug("[bridge] Falha ao enviar para %s: %s", websocket.client, e)
+
+    async def _send_control_batch(
+        self, client: _Client, first: dict, delay: float
+    ) -> None:
+        """Envia frames de controle acumulados em `delay` como um array JSON.
+
+        Só agrupa frames de texto consecutivos: um frame binário (áudio)
+        encerra o lote e é enviado logo depois, preservando a ordem.
+        """
+        await asyncio.sleep(delay)
+        texts = [first["text"]]
+        trailing = None
+        while not client.queue.empty():
+            msg = client.queue.get_nowait()
+            if "text" not in msg:
+                trailing = msg
+                break
+            texts.append(msg["text"])
+
+        if len(texts) == 1:
+            await client.websocket.send(first)
+        else:
+            # Os textos já são JSON serializado: basta concatená-los
+            await client.websocket.send(
+                {"type": "websocket.send", "text": f"[{','.join(texts)}]"}
+            )
+        if trailing is not None:
+            await client.websocket.send(trailing)
+
+    def _remove_client(self, websocket: WebSocket) -> None:
+        """Remove o cliente do broadcast e para sua task de escrita."""
+        client = self._connections.pop(websocket, None)
+        if client is None:
+            return
+        self._msgpack_clients -= client.use_msgpack
+        if client.writer:
+            client.writer.cancel()
+
+    def _drop_slow_client(self, client: _Client) -> None:
+        """Desconecta um cliente cuja fila de saída encheu."""
+        logger.warning(
+            "[bridge] Cliente lento desconectado: %s", client.websocket.client
+        )
+        # A task de escrita fecha o WebSocket ao ser cancelada
+        client.dropped = True
+        self._remove_client(client.websocket)
 
     async def _process_message(self, message: str) -> None:
         """Processa mensagens de texto (JSON) do cliente."""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             msg_type = data.get("type")
 
             if msg_type == "start_talking":
@@ -90,18 +267,15 @@ class VoiceBridge:
                 logger.debug("[bridge] stop_talking recebido")
                 await self._handle_stop()
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("[bridge] JSON inválido recebido")
 
     async def _handle_start(self) -> None:
         """Inicia sessão de fala."""
         try:
             await self._strategy.on_start_talking()
-
-            # Reinicia task de resposta
-            if self._response_task:
-                self._response_task.cancel()
-            self._response_task = asyncio.create_task(self._process_responses())
+            # Acorda o loop de respostas (sem criar task por turno)
+            self._turn_requested.set()
 
         except Exception as e:
             logger.error("[bridge] Erro ao iniciar: %s", e)
@@ -111,120 +285,288 @@ class VoiceBridge:
         """Para sessão de fala."""
         await self._strategy.on_stop_talking()
 
-    async def _handle_audio(self, chunk: bytes) -> None:
-        """Envia áudio do cliente para o Gemini."""
+    async def _handle_audio(self, chunk: bytes | memoryview) -> None:
+        """Envia áudio do cliente para o Gemini.
+
+        O chunk segue sem cópia; só é convertido para bytes no GeminiClient,
+        se ainda não for.
+        """
         await self._strategy.send_audio(chunk)
 
+    async def _response_loop(self) -> None:
+        """Task única que processa as respostas a cada start_talking.
+
+        stop_talking não limpa o sinal: a estratégia encerra o turno sozinha
+        (turn_complete), e um stop rápido não pode impedir o processamento.
+        """
+        while True:
+            await self._turn_requested.wait()
+            self._turn_requested.clear()
+            await self._process_responses()
+
     async def _process_responses(self) -> None:
         """Processa respostas do Gemini e envia para clientes."""
-        self._audio_buffer = []
+        del self._audio_buffer[:]
+        # Turno anterior pode ter terminado em erro sem 'speaking' False; o
+        # primeiro áudio deste turno volta a anunciar a fala
+        self._speaking = False
 
         try:
             async for msg in self._strategy.receive_responses():
+                audio_data, text, turn_complete = self._parse_server_content(msg)
+
                 # Processa áudio
-                if audio_data := self._extract_audio(msg):
+                if audio_data:
                     await self.send_speaking(True)
-                    await self.send_audio(audio_data)
+                    self._coalesce_audio(audio_data)
 
                     if settings.debug_play_audio_locally:
-                        self._audio_buffer.append(audio_data)
+                        self._buffer_debug_audio(audio_data)
 
                 # Processa texto
-                if text := self._extract_text(msg):
+                if text:
                     await self.send_subtitle(text)
 
                 # Fim de turno
-                if self._is_turn_complete(msg):
+                if turn_complete:
+                    # Fim de turno não espera a janela: envia o resto já
+                    self._flush_audio()
                     await self.send_speaking(False)
                     await self.send_turn_complete()
 
                     if settings.debug_play_audio_locally and self._audio_buffer:
-                        self._play_audio_locally()
+                        await self._play_audio_locally()
 
-        except asyncio.CancelledError:
-            pass
         except Exception as e:
             logger.error("[bridge] Erro no processamento: %s", e)
             await self.send_error(str(e))
+        finally:
+            self._flush_audio()
 
     # --- Métodos de Envio (Broadcast) ---
 
+    def _control_frames(self, data: dict) -> tuple[dict, dict | None]:
+        """Serializa um evento de controle para os codecs em uso."""
+        packed = _msgpack_frame(data) if self._msgpack_clients else None
+        return _text_frame(data), packed
+
+    def _audio_frames(self, data: bytes) -> tuple[dict, dict | None]:
+        """Monta os frames de áudio: PCM cru (JSON) ou evento 'audio' (msgpack)."""
+        packed = None
+        if self._msgpack_clients:
+            packed = _msgpack_frame({"type": "audio", "data": data})
+        return _bytes_frame(data), packed
+
+    def _broadcast(self, frames: tuple[dict, dict | None], audio: bool = False) -> None:
+        """Enfileira o frame para todos os clientes (sem criar tasks).
+
+        Frames de áudio acima de _CLIENT_AUDIO_LIMIT são descartados para
+        aquele cliente; frames de controle que não cabem desconectam o cliente.
+        """
+        # Itera o dict direto (sem cópia por frame); clientes lentos só são
+        # removidos depois do laço
+        stalled: list[_Client] | None = None
+        for client in self._connections.values():
+            if audio:
+                if client.queue.qsize() >= _CLIENT_AUDIO_LIMIT:
+                    client.audio_dropped += 1
+                    if client.audio_dropped == 1:
+                        logger.warning(
+                            "[bridge] Cliente lento, descartando áudio: %s",
+                            client.websocket.client,
+                        )
+                    continue
+                if client.audio_dropped:
+                    logger.info(
+                        "[bridge] Cliente %s recuperado (%d frames descartados)",
+                        client.websocket.client,
+                        client.audio_dropped,
+                    )
+                    client.audio_dropped = 0
+            try:
+                client.queue.put_nowait(frames[client.use_msgpack])
+            except asyncio.QueueFull:
+                if stalled is None:
+                    stalled = []
+                stalled.append(client)
+
+        # Política para consumidores lentos: desconecta
+        if stalled:
+            for client in stalled:
+                self._drop_slow_client(client)
+
     async def _broadcast_text(self, data: dict) -> None:
+        # Áudio ainda na janela de coalescência sai antes do evento (legenda,
+        # erro), mantendo a ordem do stream do Gemini
+        self._flush_audio()
         if not self._connections:
             return
-        msg = json.dumps(data)
-        # Envia para todos (ignora erros de envio individuais)
-        await asyncio.gather(
-            *[ws.send_text(msg) for ws in self._connections], return_exceptions=True
-        )
+        self._broadcast(self._control_frames(data))
 
-    async def _broadcast_bytes(self, data: bytes) -> None:
+    async def _broadcast_bytes(self, data: bytes | bytearray | memoryview) -> None:
         if not self._connections:
             return
-        await asyncio.gather(
-            *[ws.send_bytes(data) for ws in self._connections], return_exceptions=True
-        )
+        # ASGI exige bytes: converte no máximo uma vez e compartilha o mesmo
+        # objeto entre todos os clientes (nenhuma cópia por conexão)
+        if type(data) is not bytes:
+            data = bytes(data)
+        self._broadcast(self._audio_frames(data), audio=True)
+
+    def _coalesce_audio(self, audio_data: bytes) -> None:
+        """Agrupa áudio de saída em janelas de AUDIO_COALESCE_MS.
+
+        O envio ocorre quando a janela enche ou quando o timer (armado no
+        primeiro chunk da janela) dispara, o que vier primeiro.
+        """
+        if self._audio_window_bytes <= 0:
+            if self._connections:
+                self._broadcast(self._audio_frames(audio_data), audio=True)
+            return
+
+        self._audio_chunks.append(audio_data)
+        self._audio_pending_bytes += len(audio_data)
+        if self._audio_pending_bytes >= self._audio_window_bytes:
+            self._flush_audio()
+        elif self._audio_flush_handle is None:
+            self._audio_flush_handle = asyncio.get_running_loop().call_later(
+                settings.audio_coalesce_ms / 1000, self._flush_audio
+            )
+
+    def _flush_audio(self) -> None:
+        """Envia o áudio acumulado como um único frame binário."""
+        if self._audio_flush_handle is not None:
+            self._audio_flush_handle.cancel()
+            self._audio_flush_handle = None
+        if not self._audio_chunks:
+            return
+        # Um chunk só segue sem cópia; vários são unidos em uma única cópia
+        chunks = self._audio_chunks
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        self._audio_chunks = []
+        self._audio_pending_bytes = 0
+        if self._connections:
+            self._broadcast(self._audio_frames(data), audio=True)
 
     async def send_ready(self) -> None:
-        await self._broadcast_text({"type": "ready"})
+        if self._connections:
+            self._broadcast(_MSG_READY)
 
     async def send_speaking(self, is_speaking: bool) -> None:
-        await self._broadcast_text({"type": "speaking", "value": is_speaking})
+        # Repetir o estado a cada chunk de áudio só ocupa a fila de controle
+        if is_speaking == self._speaking:
+            return
+        self._speaking = is_speaking
+        if self._connections:
+            self._broadcast(_MSG_SPEAKING_TRUE if is_speaking else _MSG_SPEAKING_FALSE)
 
     async def send_subtitle(self, text: str) -> None:
         await self._broadcast_text({"type": "subtitle", "text": text})
 
-    async def send_audio(self, pcm_data: bytes) -> None:
+    async def send_audio(self, pcm_data: bytes | bytearray | memoryview) -> None:
         await self._broadcast_bytes(pcm_data)
 
     async def send_turn_complete(self) -> None:
-        await self._broadcast_text({"type": "turn_complete"})
+        if self._connections:
+            self._broadcast(_MSG_TURN_COMPLETE)
 
     async def send_error(self, message: str) -> None:
         await self._broadcast_text({"type": "error", "message": message})
 
     # --- Helpers ---
 
-    def _play_audio_locally(self) -> None:
-        """[DEBUG] Reproduz áudio acumulado localmente."""
+    def _buffer_debug_audio(self, audio_data: bytes) -> None:
+        """[DEBUG] Acumula áudio para playback, limitado em segundos."""
+        self._audio_buffer.extend(audio_data)
+        max_bytes = settings.debug_play_audio_max_seconds * _AUDIO_SAMPLE_RATE * 2
+        if (drop_n := len(self._audio_buffer) - max_bytes) > 0:
+            # Mantém o alinhamento de amostras int16
+            del self._audio_buffer[: drop_n + (drop_n & 1)]
+
+    async def _play_audio_locally(self) -> None:
+        """[DEBUG] Reproduz áudio acumulado localmente sem bloquear o loop."""
         if not self._audio_buffer or sd is None:
             return
 
-        all_audio = b"".join(self._audio_buffer)
-        audio_int16 = np.frombuffer(all_audio, dtype=np.int16)
-        audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        n = len(self._audio_buffer) // 2
+        # Conversão int16 -> float32 em uma única passada. O array é novo a
+        # cada turno porque o anterior pode ainda estar sendo reproduzido.
+        audio_float32 = np.multiply(
+            np.frombuffer(memoryview(self._audio_buffer), dtype=np.int16, count=n),
+            np.float32(1.0 / 32768.0),
+            dtype=np.float32,
+        )
+        # Esvazia o buffer sem recriar o objeto
+        del self._audio_buffer[:]
 
         logger.info("[bridge] [DEBUG] Reproduzindo áudio local...")
-        sd.play(audio_float32, samplerate=_AUDIO_SAMPLE_RATE)
-        sd.wait()
-        self._audio_buffer = []
-
-    def _extract_audio(self, msg: dict) -> bytes | None:
-        try:
-            parts = msg.get("serverContent", {}).get("modelTurn", {}).get("parts", [])
-            for part in parts:
-                if inline := part.get("inlineData"):
-                    if "audio" in inline.get("mimeType", ""):
-                        data = inline["data"]
-                        return (
-                            data if isinstance(data, bytes) else base64.b64decode(data)
-                        )
-        except Exception:
-            pass
-        return None
-
-    def _extract_text(self, msg: dict) -> str | None:
-        try:
-            parts = msg.get("serverContent", {}).get("modelTurn", {}).get("parts", [])
-            for part in parts:
-                if text := part.get("text"):
-                    return text
-        except Exception:
-            pass
-        return None
-
-    def _is_turn_complete(self, msg: dict) -> bool:
-        return msg.get("serverContent", {}).get("turnComplete", False)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._enqueue_playback, audio_float32)
+
+    def _enqueue_playback(self, samples: np.ndarray) -> None:
+        """[DEBUG] Abre o stream de saída se preciso e enfileira as amostras."""
+        if self._sd_stream is None:
+            self._sd_stream = sd.OutputStream(
+                samplerate=_AUDIO_SAMPLE_RATE,
+                channels=1,
+                dtype="float32",
+                callback=self._sd_callback,
+            )
+            self._sd_stream.start()
+        self._sd_queue.put(samples)
+
+    def _sd_callback(self, outdata: np.ndarray, frames: int, time_info, status) -> None:
+        """[DEBUG] Callback do PortAudio: copia amostras enfileiradas."""
+        written = 0
+        while written < frames:
+            if self._sd_pending is None:
+                try:
+                    self._sd_pending = self._sd_queue.get_nowait()
+                except queue.Empty:
+                    outdata[written:] = 0  # Silêncio até o próximo turno
+                    return
+                self._sd_pos = 0
+
+            chunk = self._sd_pending[self._sd_pos : self._sd_pos + frames - written]
+            outdata[written : written + len(chunk), 0] = chunk
+            written += len(chunk)
+            self._sd_pos += len(chunk)
+            if self._sd_pos >= len(self._sd_pending):
+                self._sd_pending = None
+
+    def _parse_server_content(
+        self, msg: dict, _get=dict.get
+    ) -> tuple[bytes, str | None, bool]:
+        """Extrai (áudio, texto, fim de turno) percorrendo a mensagem uma vez.
+
+        Retorna o primeiro áudio e o primeiro texto encontrados nos parts.
+        """
+        audio, text = _EMPTY, None
+        sc = _get(msg, "serverContent") or _NO_CONTENT
+        mt = _get(sc, "modelTurn") or _NO_CONTENT
+        parts = _get(mt, "parts") or ()
+        # Mensagens vêm do conversor do GeminiClient (só dicts/listas), então
+        # basta validar o formato de 'parts' em vez de envolver tudo em try
+        if not isinstance(parts, list):
+            parts = ()
+        for part in parts:
+            if not text:
+                text = _get(part, "text")
+            if not audio and (inline := _get(part, "inlineData")):
+                if "audio" in _get(inline, "mimeType", "") and (
+                    data := _get(inline, "data")
+                ):
+                    # O SDK já entrega bytes; só decodifica payloads base64
+                    if isinstance(data, bytes):
+                        audio = data
+                    else:
+                        # ValueError cobre binascii.Error e str não-ASCII
+                        try:
+                            audio = _b64decode(data, validate=False)
+                        except ValueError:
+                            logger.warning("[bridge] Áudio base64 inválido ignorado")
+            if audio and text:
+                break
+        return audio, text, _get(sc, "turnComplete", False)
 
     async def shutdown(self) -> None:
         """Encerra conexões e estratégia."""
@@ -234,11 +576,15 @@ class VoiceBridge:
 
         await self._strategy.shutdown()
 
+        if self._sd_stream is not None:
+            self._sd_stream.close()
+            self._sd_stream = None
+
         # Fecha conexões WebSocket
         for ws in list(self._connections):
+            self._remove_client(ws)
             try:
                 await ws.close()
             except Exception:
                 pass
-        self._connections.clear()
         logger.info("[bridge] Encerrado.")
@@ -1,6 +1,8 @@
 """CLI entry point para o AI Voice Bridge (FastAPI/Uvicorn)."""
 
+import importlib.util
 import logging
+import socket
 import sys
 
 import uvicorn
@@ -17,9 +19,15 @@ class ColoredFormatter(logging.Formatter):
     RED = "\033[31m"
     RESET = "\033[0m"
 
+    # Cor por nome exato de logger (lookup O(1) em vez de busca por substring)
+    LOGGER_COLORS = {"ai_voice_bridge.gemini_client": BLUE}
+
     def format(self, record: logging.LogRecord) -> str:
-        if "gemini" in record.name:
-            record.msg = f"{self.BLUE}{record.msg}{self.RESET}"
+        # Logs DEBUG (por chunk de áudio) ficam sem cor para economizar CPU
+        if record.levelno > logging.DEBUG and (
+            color := self.LOGGER_COLORS.get(record.name)
+        ):
+            record.msg = f"{color}{record.msg}{self.RESET}"
         return super().format(record)
 
 
@@ -40,6 +48,29 @@ def configure_logging() -> None:
     )
 
 
+# Tamanho máximo de mensagem WebSocket aceita (chunks de áudio têm poucos KB)
+_WS_MAX_SIZE = 2**20
+
+
+def _is_installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def select_event_loop() -> str:
+    """Escolhe o event loop do Uvicorn (uvloop quando disponível)."""
+    if settings.event_loop.lower() != "auto":
+        return settings.event_loop
+    # uvloop é POSIX-only; no Windows usa o loop padrão do asyncio
+    if sys.platform != "win32" and _is_installed("uvloop"):
+        return "uvloop"
+    return "asyncio"
+
+
+def select_http_parser() -> str:
+    """Escolhe o parser HTTP do Uvicorn (httptools, em C, quando disponível)."""
+    return "httptools" if _is_installed("httptools") else "h11"
+
+
 def main() -> None:
     """Ponto de entrada da CLI."""
     configure_logging()
@@ -48,13 +79,40 @@ def main() -> None:
 
     # Executa o Uvicorn
     # reload=False em produção (pode ser True em dev se desejado, mas vamos manter simples)
-    uvicorn.run(
+    config = uvicorn.Config(
         "ai_voice_bridge.main:app",
         host=settings.host,
         port=settings.port,
         log_level=settings.logging_level.lower(),
+        # Fixa as implementações em C (uvloop/httptools) e o WebSocket da lib
+        # 'websockets' para não cair em parsers puro-Python por frame de áudio.
+        # Em produção, prefira Linux (epoll) com kernel recente.
+        # TCP_NODELAY: asyncio e uvloop já desativam o Nagle em toda conexão
+        # TCP aceita, então frames pequenos de controle/áudio não são retidos.
+        loop=select_event_loop(),
+        http=select_http_parser(),
+        ws="websockets",
+        ws_max_size=_WS_MAX_SIZE,
         ws_ping_interval=None,  # Deixa o app gerenciar pings se necessário
+        # Sem permessage-deflate: PCM quase não comprime e o zlib custaria CPU
+        # em todo frame de áudio
+        ws_per_message_deflate=False,
     )
+    server = uvicorn.Server(config)
+
+    # O socket de escuta é criado aqui para ajustar opções herdadas pelas
+    # conexões aceitas (o ASGI não expõe o socket de cada WebSocket)
+    sock = config.bind_socket()
+    # Opcional: um SO_SNDBUF fixo desativa o autoajuste do buffer no Linux
+    if settings.socket_send_buffer > 0:
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, settings.socket_send_buffer
+        )
+
+    try:
+        server.run(sockets=[sock])
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
@@ -33,18 +33,31 @@ class Settings(BaseSettings):
     # Audio Settings (PCM 16-bit, Mono)
     input_sample_rate: int = 16000  # Cliente → Gemini
     output_sample_rate: int = 24000  # Gemini → Cliente
+    # Janela para agrupar áudio de saída em menos frames (0 = envia cada chunk)
+    audio_coalesce_ms: int = 200
 
     # === WebSocket Server ===
     # Host onde o servidor irá escutar (0.0.0.0 para expor na rede)
     host: str = "0.0.0.0"
     # Porta do servidor
     port: int = 8765
+    # SO_SNDBUF (bytes) das conexões aceitas; 0 mantém o autoajuste do kernel.
+    # Um valor fixo desliga o autoajuste e é limitado por net.core.wmem_max
+    socket_send_buffer: int = 0
+    # Event loop do Uvicorn: "auto" (uvloop se disponível), "asyncio", "uvloop"
+    # ou caminho de import de um loop alternativo aceito pelo Uvicorn
+    event_loop: str = "auto"
+    # Agrupa frames de controle JSON enfileirados em até N ms num array JSON
+    # (0 = desativado; o cliente precisa aceitar objeto único ou array)
+    control_batch_ms: int = 0
 
     # History (On-Demand mode)
     max_history_messages: int = 20
 
     # Debug
     debug_play_audio_locally: bool = False
+    # Máximo de áudio retido para o playback de debug (descarta o início)
+    debug_play_audio_max_seconds: int = 30
     logging_level: str = "INFO"
 
 
@@ -1,5 +1,7 @@
 """Cliente para Gemini Live API usando o SDK oficial google-genai."""
 
+import asyncio
+import functools
 import logging
 from typing import AsyncIterator
 
@@ -11,14 +13,31 @@ from ai_voice_bridge.config import settings
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def get_genai_client() -> genai.Client:
+    """Retorna o genai.Client compartilhado pelo processo (criado sob demanda).
+
+    O SDK não exige serialização no setup da sessão Live, então não há lock.
+    """
+    return genai.Client(api_key=settings.google_api_key)
+
+
 class GeminiClient:
     """Cliente para Gemini Live API (streaming bidirecional de áudio)."""
 
     def __init__(self) -> None:
-        self._client = genai.Client(api_key=settings.google_api_key)
         self._session = None
         self._context_manager = None
         self._is_connected = False
+        # Setado sempre que a conexão cai ou é fechada (acorda quem reconecta)
+        self.disconnected = asyncio.Event()
+        self.disconnected.set()
+        # Blob de áudio reutilizado; só 'data' muda a cada chunk. Passar um
+        # types.Blob pronto evita a validação dict -> Blob do SDK por envio.
+        self._audio_blob = types.Blob(
+            data=b"",
+            mime_type=f"audio/pcm;rate={settings.input_sample_rate}",
+        )
 
     @property
     def is_connected(self) -> bool:
@@ -36,31 +55,34 @@ class GeminiClient:
         }
 
         # Live API retorna um async context manager
-        self._context_manager = self._client.aio.live.connect(
+        self._context_manager = get_genai_client().aio.live.connect(
             model=settings.gemini_model,
             config=config,
         )
         # Entra no context manager manualmente
         self._session = await self._context_manager.__aenter__()
         self._is_connected = True
+        self.disconnected.clear()
         logger.info("[gemini] Conexão estabelecida via SDK")
 
-    async def send_audio(self, pcm_chunk: bytes) -> None:
+    async def send_audio(self, pcm_chunk: bytes | memoryview) -> None:
         """Envia chunk de áudio PCM para Gemini."""
         if not self.is_connected or self._session is None:
             return
 
+        # O SDK valida 'data' como bytes; converte apenas buffers emprestados
+        if type(pcm_chunk) is not bytes:
+            pcm_chunk = bytes(pcm_chunk)
+
         try:
             logger.debug("[gemini] Enviando %d bytes de áudio", len(pcm_chunk))
-            await self._session.send_realtime_input(
-                audio={
-                    "data": pcm_chunk,
-                    "mime_type": "audio/pcm",
-                }
-            )
+            # O SDK valida e serializa o payload antes do primeiro await, então
+            # mutar o Blob compartilhado entre envios é seguro
+            self._audio_blob.data = pcm_chunk
+            await self._session.send_realtime_input(audio=self._audio_blob)
         except Exception as e:
             logger.warning("[gemini] Erro ao enviar áudio: %s", e)
-            self._is_connected = False
+            self._mark_disconnected()
 
     async def receive_messages(self) -> AsyncIterator[dict]:
         """Gera mensagens recebidas do Gemini."""
@@ -74,47 +96,49 @@ class GeminiClient:
                 yield self._convert_response(response)
         except Exception as e:
             logger.error("[gemini] Erro ao receber: %s", e)
-            self._is_connected = False
+            self._mark_disconnected()
+
+    def _mark_disconnected(self) -> None:
+        """Marca a conexão como perdida e sinaliza o evento."""
+        self._is_connected = False
+        self.disconnected.set()
 
     def _convert_response(self, response) -> dict:
-        """Converte resposta do SDK para o formato dict esperado pelo bridge."""
+        """Converte resposta do SDK para o formato dict esperado pelo bridge.
+
+        As respostas são modelos pydantic do SDK: todos os campos existem
+        (None quando ausentes), então o acesso direto dispensa hasattr/getattr.
+        """
         result = {}
 
-        if hasattr(response, "server_content") and response.server_content:
-            server_content = {
-                "turnComplete": getattr(response.server_content, "turn_complete", False)
-            }
+        if server_content := response.server_content:
+            converted = {"turnComplete": server_content.turn_complete or False}
 
-            if (
-                hasattr(response.server_content, "model_turn")
-                and response.server_content.model_turn
-            ):
+            if model_turn := server_content.model_turn:
                 parts = []
-                for part in response.server_content.model_turn.parts:
-                    if hasattr(part, "text") and part.text:
-                        parts.append({"text": part.text})
-                    elif hasattr(part, "inline_data") and part.inline_data:
+                for part in model_turn.parts or ():
+                    if text := part.text:
+                        parts.append({"text": text})
+                    elif inline_data := part.inline_data:
                         # Áudio binário
                         parts.append(
                             {
                                 "inlineData": {
-                                    "mimeType": getattr(
-                                        part.inline_data, "mime_type", "audio/pcm"
-                                    ),
-                                    "data": part.inline_data.data,  # já é bytes
+                                    "mimeType": inline_data.mime_type or "audio/pcm",
+                                    "data": inline_data.data,  # já é bytes
                                 }
                             }
                         )
                 if parts:
-                    server_content["modelTurn"] = {"parts": parts}
+                    converted["modelTurn"] = {"parts": parts}
 
-            result["serverContent"] = server_content
+            result["serverContent"] = converted
 
         return result
 
     async def close(self) -> None:
         """Fecha a conexão."""
-        self._is_connected = False
+        self._mark_disconnected()
         if self._context_manager and self._session:
             try:
                 await self._context_manager.__aexit__(None, None, None)
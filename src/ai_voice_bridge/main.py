@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from ai_voice_bridge.bridge import VoiceBridge
 from ai_voice_bridge.config import settings
@@ -44,20 +44,29 @@ app = FastAPI(
 )
 
 
-@app.api_route("/", methods=["GET", "HEAD"], tags=["Health"])
-async def root() -> dict[str, str]:
-    """Retorna mensagem de boas-vindas."""
-    return {
+# Respostas fixas criadas uma única vez (o corpo já vem serializado); o
+# Starlette não guarda estado por requisição nelas, então podem ser reusadas
+_ROOT_RESPONSE = JSONResponse(
+    {
         "message": "AI Voice Bridge is running",
         "version": app.version,
         "docs": "/docs",
     }
+)
+_FAVICON_RESPONSE = Response(status_code=204)
+_HEALTH_RESPONSE = PlainTextResponse("OK")
+
+
+@app.api_route("/", methods=["GET", "HEAD"], tags=["Health"])
+async def root() -> Response:
+    """Retorna mensagem de boas-vindas."""
+    return _ROOT_RESPONSE
 
 
 @app.get("/favicon.ico", include_in_schema=False)
 async def favicon() -> Response:
     """Retorna 204 No Content para evitar 404 nos logs."""
-    return Response(status_code=204)
+    return _FAVICON_RESPONSE
 
 
 @app.api_route(
@@ -66,9 +75,9 @@ async def favicon() -> Response:
     response_class=PlainTextResponse,
     tags=["Health"],
 )
-async def health_check() -> str:
+async def health_check() -> Response:
     """Endpoint de health check para o Render/K8s."""
-    return "OK"
+    return _HEALTH_RESPONSE
 
 
 @app.websocket("/ws")
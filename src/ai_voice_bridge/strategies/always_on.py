@@ -1,6 +1,7 @@
 """Estratégia Always-On: conexão persistente com auto-reconexão."""
 
 import asyncio
+import contextlib
 import logging
 from typing import AsyncIterator
 
@@ -10,38 +11,80 @@ from ai_voice_bridge.strategies.base import SessionStrategy
 
 logger = logging.getLogger(__name__)
 
+# Mensagens do Gemini retidas até o bridge consumir (aplica backpressure)
+_RESPONSE_QUEUE_SIZE = 256
+
+# Backoff exponencial (segundos) entre tentativas de reconexão
+_RECONNECT_BACKOFF_MIN = 1
+_RECONNECT_BACKOFF_MAX = 30
+
 
 class AlwaysOnStrategy(SessionStrategy):
     """Estratégia 'Always-On': conexão persistente com auto-reconexão."""
 
     def __init__(self, gemini: GeminiClient) -> None:
         super().__init__(gemini)
-        self._reconnect_task: asyncio.Task | None = None
+        # Task única que supervisiona monitor de reconexão e leitor
+        self._background_task: asyncio.Task | None = None
         self._should_run = True
+        # None é sentinela: acorda o consumidor quando as tasks de fundo falham
+        self._queue: asyncio.Queue[dict | None] = asyncio.Queue(
+            maxsize=_RESPONSE_QUEUE_SIZE
+        )
+        self._failure: BaseException | None = None
+        self._connected = asyncio.Event()
+        # True quando a sessão atual já entregou mensagens (zera o backoff)
+        self._session_healthy = False
 
     async def initialize(self) -> None:
-        """Conecta imediatamente e inicia monitor de reconexão."""
+        """Conecta imediatamente e inicia monitor de reconexão e leitor."""
         await self._connect()
-        self._reconnect_task = asyncio.create_task(self._reconnect_monitor())
+        self._background_task = asyncio.create_task(self._run_background())
         logger.info("[always-on] Estratégia inicializada com conexão ativa")
 
+    async def _run_background(self) -> None:
+        """Roda monitor e leitor num TaskGroup: encerram (ou falham) juntos."""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._reconnect_monitor())
+                tg.create_task(self._reader_loop())
+        except* Exception as eg:
+            logger.error("[always-on] Falha nas tasks de background: %s", eg.exceptions)
+            # Sem leitor a fila nunca mais recebe nada: repassa a falha para
+            # receive_responses em vez de deixar o bridge bloqueado
+            self._failure = eg.exceptions[0]
+            # Fila cheia dispensa o sentinela: o consumidor checa _failure antes
+            with contextlib.suppress(asyncio.QueueFull):
+                self._queue.put_nowait(None)
+
     async def _connect(self) -> None:
         """Cria nova conexão com Gemini."""
+        self._session_healthy = False
         await self._gemini.connect(settings.system_prompt)
+        self._connected.set()
         logger.info("[always-on] Conexão estabelecida")
 
     async def _reconnect_monitor(self) -> None:
-        """Monitor que reconecta automaticamente em caso de queda."""
+        """Monitor que reconecta assim que o GeminiClient sinaliza queda."""
+        backoff = _RECONNECT_BACKOFF_MIN
         while self._should_run:
             try:
-                await asyncio.sleep(1)
-                if not self._gemini.is_connected:
-                    logger.warning("[always-on] Conexão perdida, reconectando...")
-                    try:
-                        await self._connect()
-                    except Exception as e:
-                        logger.error("[always-on] Falha na reconexão: %s", e)
-                        await asyncio.sleep(5)  # Backoff
+                await self._gemini.disconnected.wait()
+                if not self._should_run:
+                    break
+                # Só volta ao mínimo se a sessão anterior chegou a funcionar:
+                # sessão que cai logo após conectar continua no backoff
+                if self._session_healthy:
+                    backoff = _RECONNECT_BACKOFF_MIN
+                logger.warning(
+                    "[always-on] Conexão perdida, reconectando em %ss...", backoff
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _RECONNECT_BACKOFF_MAX)
+                try:
+                    await self._connect()
+                except Exception as e:
+                    logger.error("[always-on] Falha na reconexão: %s", e)
             except asyncio.CancelledError:
                 break
 
@@ -53,29 +96,52 @@ class AlwaysOnStrategy(SessionStrategy):
         """Mantém conexão ativa."""
         pass
 
-    async def send_audio(self, pcm_chunk: bytes) -> None:
+    async def send_audio(self, pcm_chunk: bytes | memoryview) -> None:
         """Envia áudio para Gemini se conectado."""
         if self._gemini.is_connected:
             await self._gemini.send_audio(pcm_chunk)
 
+    async def _reader_loop(self) -> None:
+        """Única leitora da sessão: repassa mensagens do Gemini para a fila."""
+        while self._should_run:
+            if not self._gemini.is_connected:
+                # Dorme até o monitor reconectar (sem polling)
+                self._connected.clear()
+                await self._connected.wait()
+                continue
+
+            received = False
+            try:
+                # receive_messages() termina a cada turno; reentra em seguida
+                async for msg in self._gemini.receive_messages():
+                    received = True
+                    self._session_healthy = True
+                    await self._queue.put(msg)
+            except Exception as e:
+                logger.warning("[always-on] Erro no receive: %s", e)
+            if not received:
+                # Sessão encerrou sem mensagens: evita laço ocupado
+                await asyncio.sleep(0.1)
+
     async def receive_responses(self) -> AsyncIterator[dict]:
-        """Recebe respostas do Gemini continuamente."""
+        """Recebe respostas do Gemini continuamente (via leitor em background)."""
         while self._should_run:
-            if self._gemini.is_connected:
-                try:
-                    async for msg in self._gemini.receive_messages():
-                        yield msg
-                except Exception as e:
-                    logger.warning("[always-on] Erro no receive: %s", e)
-            await asyncio.sleep(0.1)
+            if self._failure is not None:
+                raise RuntimeError(
+                    f"Conexão always-on encerrada: {self._failure}"
+                ) from self._failure
+            msg = await self._queue.get()
+            if msg is not None:
+                yield msg
 
     async def shutdown(self) -> None:
         """Encerra a estratégia e para o monitor."""
         self._should_run = False
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
+        if self._background_task:
+            # Cancelar o supervisor cancela monitor e leitor via TaskGroup
+            self._background_task.cancel()
             try:
-                await self._reconnect_task
+                await self._background_task
             except asyncio.CancelledError:
                 pass
         await self._gemini.close()
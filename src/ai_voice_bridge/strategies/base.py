@@ -28,7 +28,7 @@ class SessionStrategy(ABC):
         ...
 
     @abstractmethod
-    async def send_audio(self, pcm_chunk: bytes) -> None:
+    async def send_audio(self, pcm_chunk: bytes | memoryview) -> None:
         """Envia áudio para Gemini."""
         ...
 
@@ -22,6 +22,8 @@ class OnDemandStrategy(SessionStrategy):
         self._history: list[dict[str, str]] = []
         self._is_active = False
         self._pending_close = False  # Marca que deve fechar após turn_complete
+        # Último prompt montado, chaveado por (len(_history), max_history_messages)
+        self._cached_prompt: tuple[tuple[int, int], str] | None = None
 
     async def initialize(self) -> None:
         """Inicializa a estratégia (aguarda start_talking)."""
@@ -52,7 +54,7 @@ class OnDemandStrategy(SessionStrategy):
         self._pending_close = True
         # NÃO fecha aqui - aguarda turn_complete em receive_responses()
 
-    async def send_audio(self, pcm_chunk: bytes) -> None:
+    async def send_audio(self, pcm_chunk: bytes | memoryview) -> None:
         """Envia áudio para Gemini se sessão estiver ativa."""
         if self._is_active:
             await self._gemini.send_audio(pcm_chunk)
@@ -93,26 +95,40 @@ class OnDemandStrategy(SessionStrategy):
         if not self._history:
             return base
 
+        # O histórico só cresce: o tamanho basta para invalidar o cache
+        key = (len(self._history), settings.max_history_messages)
+        if self._cached_prompt and self._cached_prompt[0] == key:
+            return self._cached_prompt[1]
+
         # Limita histórico
         recent = self._history[-settings.max_history_messages :]
 
-        history_text = "\n\n--- Previous Conversation ---\n"
-        for msg in recent:
-            role = "User" if msg["role"] == "user" else "Assistant"
-            history_text += f"{role}: {msg['content']}\n"
-        history_text += "--- End History ---\n\n"
-
-        return f"{base}\n{history_text}Continue the conversation naturally."
+        prompt = "".join(
+            [
+                base,
+                "\n\n\n--- Previous Conversation ---\n",
+                *(
+                    f"{'User' if msg['role'] == 'user' else 'Assistant'}: "
+                    f"{msg['content']}\n"
+                    for msg in recent
+                ),
+                "--- End History ---\n\n",
+                "Continue the conversation naturally.",
+            ]
+        )
+        self._cached_prompt = (key, prompt)
+        return prompt
 
     def _extract_text(self, msg: dict) -> str | None:
         """Extrai texto da resposta Gemini."""
-        try:
-            parts = msg.get("serverContent", {}).get("modelTurn", {}).get("parts", [])
-            for part in parts:
-                if text := part.get("text"):
-                    return text
-        except Exception:
-            pass
+        parts = msg.get("serverContent", {}).get("modelTurn", {}).get("parts", [])
+        # Mensagens vêm do conversor do GeminiClient (só dicts/listas), então
+        # basta validar o formato de 'parts' em vez de envolver tudo em try
+        if not isinstance(parts, list):
+            return None
+        for part in parts:
+            if text := part.get("text"):
+                return text
         return None
 
     def _is_turn_complete(self, msg: dict) -> bool: